@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Generate complete icon sets for many white-labelled brands in one run
+"""
+
+from collections import Counter
+from multiprocessing import Pool
+import argparse
+import csv
+import json
+import os
+import re
+import time
+import zipfile
+
+from PIL import ImageColor
+
+from generate_new_icons import (
+    DEFAULT_BACKGROUND, DEFAULT_HEART_COLOR, DEFAULT_LINE_COLOR, DEFAULT_TEXT_COLOR,
+    ICON_SIZES, render_icon_set, text_fits
+)
+
+COLOR_DEFAULTS = {
+    'background': DEFAULT_BACKGROUND,
+    'heart_color': DEFAULT_HEART_COLOR,
+    'line_color': DEFAULT_LINE_COLOR,
+    'text_color': DEFAULT_TEXT_COLOR,
+}
+
+# Separates explicit lines in 'text' or a string 'text_lines' (CSV cells can't hold lists)
+LINE_SEPARATOR = '|'
+
+# PNG and ICO payloads are already compressed; deflating them again only costs CPU
+STORED_EXTENSIONS = {'.png', '.ico'}
+
+def load_brand_specs(path):
+    """Yield (location, spec dict) pairs from a .csv or .jsonl file"""
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith('.csv'):
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield f"{path}:{reader.line_num}", row
+        else:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    spec = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line_number}: invalid JSON ({e})")
+                if not isinstance(spec, dict):
+                    raise ValueError(f"{path}:{line_number}: brand spec must be a JSON object")
+                yield f"{path}:{line_number}", spec
+
+def parse_text_lines(spec):
+    """Return the icon text lines for a spec: explicit lines, '|'-separated text, or one word per line"""
+    text_lines = spec.get('text_lines')
+    if isinstance(text_lines, str):
+        text_lines = text_lines.split(LINE_SEPARATOR)
+    elif text_lines is None:
+        text = (spec.get('text') or spec.get('name') or '').strip()
+        # Without a separator, stack one word per line like "Bradley" / "Health"
+        text_lines = text.split(LINE_SEPARATOR) if LINE_SEPARATOR in text else text.split()
+    elif not isinstance(text_lines, list) or not all(isinstance(line, str) for line in text_lines):
+        raise ValueError("'text_lines' must be a list of strings or a '|'-separated string")
+    return tuple(line.strip() for line in text_lines if line.strip())
+
+def normalize_brand(spec, location='brand spec'):
+    """Fill in defaults for a brand spec, derive its slug and text lines, and validate it"""
+    try:
+        text_lines = parse_text_lines(spec)
+    except ValueError as e:
+        raise ValueError(f"{location}: {e}")
+    if not text_lines:
+        raise ValueError(f"{location}: brand spec needs 'text', 'name' or 'text_lines'")
+
+    # Slugs become folder names, so keep them to safe path characters
+    slug = spec.get('slug') or " ".join(text_lines)
+    slug = re.sub(r'[^a-z0-9]+', '-', str(slug).strip().lower()).strip('-')
+    if not slug:
+        raise ValueError(f"{location}: brand spec has no usable slug")
+
+    brand = {'slug': slug, 'text_lines': text_lines}
+
+    # Reject bad colors here, naming the brand, rather than inside a pool worker
+    for key, default in COLOR_DEFAULTS.items():
+        color = spec.get(key) or default
+        try:
+            if not isinstance(color, str):
+                raise ValueError
+            ImageColor.getrgb(color)
+        except ValueError:
+            raise ValueError(f"{location} ({slug}): invalid {key} {color!r}")
+        brand[key] = color
+
+    # Text is drawn from 72px up; anything cut off there ships a broken icon
+    for filename, size in ICON_SIZES.items():
+        if size >= 72 and not text_fits(size, text_lines):
+            raise ValueError(
+                f"{location} ({slug}): text {list(text_lines)} does not fit in {filename} "
+                f"({size}x{size}); use fewer or shorter lines via 'text_lines' or '|'"
+            )
+
+    return brand
+
+def render_brand(brand):
+    """Pool worker: render one brand's icon set; fonts and masks stay cached per process"""
+    files = render_icon_set(
+        text_lines=brand['text_lines'],
+        background=brand['background'],
+        heart_color=brand['heart_color'],
+        line_color=brand['line_color'],
+        text_color=brand['text_color'],
+    )
+    return brand['slug'], files
+
+class ZipSink:
+    """Write each finished icon set into one ZIP under a per-brand folder"""
+
+    def __init__(self, path):
+        self.zip = zipfile.ZipFile(path, 'w')
+
+    def write(self, slug, files):
+        for filename, data in files:
+            extension = os.path.splitext(filename)[1].lower()
+            compression = zipfile.ZIP_STORED if extension in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+            self.zip.writestr(f"{slug}/{filename}", data, compress_type=compression)
+
+    def close(self):
+        self.zip.close()
+
+class DirectorySink:
+    """Write each finished icon set into its own directory"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, slug, files):
+        brand_dir = os.path.join(self.path, slug)
+        os.makedirs(brand_dir, exist_ok=True)
+        for filename, data in files:
+            with open(os.path.join(brand_dir, filename), 'wb') as f:
+                f.write(data)
+
+    def close(self):
+        pass
+
+def generate_brand_icon_sets(specs_path, output, workers=None):
+    """Render every brand in specs_path into output; return (set count, elapsed seconds)"""
+    brands = [normalize_brand(spec, location) for location, spec in load_brand_specs(specs_path)]
+
+    slug_counts = Counter(brand['slug'] for brand in brands)
+    duplicates = sorted(slug for slug, count in slug_counts.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate brand slugs: {', '.join(duplicates)}")
+
+    sink = ZipSink(output) if output.lower().endswith('.zip') else DirectorySink(output)
+    start = time.perf_counter()
+    count = 0
+    try:
+        with Pool(processes=workers) as pool:
+            # Sets are written as they finish, so only in-flight sets are held in memory
+            for slug, files in pool.imap_unordered(render_brand, brands, chunksize=4):
+                sink.write(slug, files)
+                count += 1
+                print(f"  ✅ {slug}")
+    finally:
+        sink.close()
+
+    return count, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate icon sets for many brands')
+    parser.add_argument('specs', help='CSV or JSONL file of brand specs (text or text_lines, '
+                        'slug, background, heart_color, line_color, text_color)')
+    parser.add_argument('-o', '--output', default='brand-icons.zip',
+                        help='ZIP file or output directory (default: brand-icons.zip)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    print(f"🎨 Generating brand icon sets from {args.specs}...")
+
+    try:
+        count, elapsed = generate_brand_icon_sets(args.specs, args.output, args.workers)
+    except ValueError as e:
+        parser.error(str(e))
+    except OSError as e:
+        parser.error(f"{e.filename}: {e.strerror}")
+
+    rate = count / elapsed if elapsed else 0.0
+    print(f"\n🎉 {count} icon sets written to {args.output}")
+    print(f"⏱️  {elapsed:.2f}s ({rate:.1f} sets/sec)")
+
+if __name__ == "__main__":
+    main()
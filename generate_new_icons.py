@@ -3,14 +3,49 @@
 Generate Bradley Health branded app icons with text
 """
 
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
+import io
 import os
+from xml.sax.saxutils import escape
 
-def create_heart_icon(size, text=True):
-    """Create a heart icon with ECG line and optional text"""
-    # Create image with blue background
-    img = Image.new('RGB', (size, size), '#3b82f6')
-    draw = ImageDraw.Draw(img)
+# Default brand; white-label builds override these per clinic
+DEFAULT_TEXT_LINES = ("Bradley", "Health")
+DEFAULT_BACKGROUND = '#3b82f6'
+DEFAULT_HEART_COLOR = '#ef4444'
+DEFAULT_LINE_COLOR = 'white'
+DEFAULT_TEXT_COLOR = 'white'
+
+ICON_SIZES = {
+    'icon-72.png': 72,
+    'icon-96.png': 96,
+    'icon-144.png': 144,
+    'apple-touch-icon.png': 180,
+    'icon-192.png': 192,
+    'icon-512.png': 512
+}
+
+FAVICON_SIZES = [(16, 16), (32, 32), (48, 48)]
+
+@lru_cache(maxsize=None)
+def load_font(font_size):
+    """Load the icon font once per size; truetype() re-reads the file on every call"""
+    try:
+        # Try to use a system font
+        return ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
+    except:
+        try:
+            return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
+        except:
+            return ImageFont.load_default()
+
+@lru_cache(maxsize=None)
+def create_heart_masks(size):
+    """Create the heart and ECG line masks for a size; shared by every brand"""
+    heart_mask = Image.new('L', (size, size), 0)
+    line_mask = Image.new('L', (size, size), 0)
+    heart_draw = ImageDraw.Draw(heart_mask)
+    line_draw = ImageDraw.Draw(line_mask)
     
     # Calculate scaling factor
     scale = size / 180
@@ -27,13 +62,13 @@ def create_heart_icon(size, text=True):
     heart_bottom = heart_center_y + heart_radius // 2
     
     # Draw heart shape (two circles and triangle)
-    draw.ellipse([heart_left, heart_top, heart_center_x, heart_bottom], fill='#ef4444')
-    draw.ellipse([heart_center_x, heart_top, heart_right, heart_bottom], fill='#ef4444')
-    draw.polygon([
+    heart_draw.ellipse([heart_left, heart_top, heart_center_x, heart_bottom], fill=255)
+    heart_draw.ellipse([heart_center_x, heart_top, heart_right, heart_bottom], fill=255)
+    heart_draw.polygon([
         (heart_center_x, heart_bottom),
         (heart_left - int(5 * scale), heart_center_y + int(10 * scale)),
         (heart_right + int(5 * scale), heart_center_y + int(10 * scale))
-    ], fill='#ef4444')
+    ], fill=255)
     
     # Draw ECG line
     line_y = heart_center_y
@@ -58,79 +93,116 @@ def create_heart_icon(size, text=True):
     ]
     
     for i in range(len(ecg_points) - 1):
-        draw.line([ecg_points[i], ecg_points[i + 1]], fill='white', width=line_width)
+        line_draw.line([ecg_points[i], ecg_points[i + 1]], fill=255, width=line_width)
+    
+    return heart_mask, line_mask
+
+def text_layout(size):
+    """Return (font, first line y, line step) for icon text; shared by drawing and fit checks"""
+    scale = size / 180
+    font = load_font(max(8, int(16 * scale)))
+    text_y = size // 2 - int(10 * scale) + int(35 * scale)
+    return font, text_y, int(20 * scale)
+
+def create_heart_icon(size, text=True, text_lines=DEFAULT_TEXT_LINES,
+                      background=DEFAULT_BACKGROUND, heart_color=DEFAULT_HEART_COLOR,
+                      line_color=DEFAULT_LINE_COLOR, text_color=DEFAULT_TEXT_COLOR):
+    """Create a heart icon with ECG line and optional text"""
+    # Create image with brand background
+    img = Image.new('RGB', (size, size), background)
+    
+    # Fill the cached heart and ECG shapes with the brand colors
+    heart_mask, line_mask = create_heart_masks(size)
+    img.paste(heart_color, mask=heart_mask)
+    img.paste(line_color, mask=line_mask)
     
     # Add text if requested and size is large enough
     if text and size >= 72:
-        try:
-            # Try to use a system font
-            font_size = max(8, int(16 * scale))
-            font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-        except:
-            try:
-                font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-            except:
-                font = ImageFont.load_default()
-        
-        text_y = heart_center_y + int(35 * scale)
-        text_color = 'white'
+        draw = ImageDraw.Draw(img)
+        font, text_y, line_step = text_layout(size)
         
-        # Draw "Bradley Health" text
-        text_lines = ["Bradley", "Health"]
+        # Draw brand text, one line per entry
         for i, line in enumerate(text_lines):
             bbox = draw.textbbox((0, 0), line, font=font)
             text_width = bbox[2] - bbox[0]
             text_x = (size - text_width) // 2
-            draw.text((text_x, text_y + i * int(20 * scale)), line, fill=text_color, font=font)
+            draw.text((text_x, text_y + i * line_step), line, fill=text_color, font=font)
     
     return img
 
+def text_fits(size, text_lines):
+    """Check whether text_lines fit inside a size x size icon with the standard layout"""
+    img = Image.new('L', (size, size))
+    draw = ImageDraw.Draw(img)
+    font, text_y, line_step = text_layout(size)
+    
+    for i, line in enumerate(text_lines):
+        bbox = draw.textbbox((0, text_y + i * line_step), line, font=font)
+        if bbox[2] - bbox[0] > size or bbox[3] > size:
+            return False
+    return True
+
+def create_favicon_svg(text="Bradley Health", background=DEFAULT_BACKGROUND,
+                       heart_color=DEFAULT_HEART_COLOR, line_color=DEFAULT_LINE_COLOR,
+                       text_color=DEFAULT_TEXT_COLOR):
+    """Create favicon.svg markup for a brand"""
+    text = escape(text)
+    background, heart_color, line_color, text_color = (
+        escape(color, {'"': '&quot;'})
+        for color in (background, heart_color, line_color, text_color)
+    )
+    return f'''<svg width="32" height="32" viewBox="0 0 32 32" xmlns="http://www.w3.org/2000/svg">
+  <rect width="32" height="32" rx="4" fill="{background}"/>
+  <path d="M16 8c-2 0-4 1-4 3 0 1 0 2 1 3l3 3 3-3c1-1 1-2 1-3 0-2-2-3-4-3z" fill="{heart_color}"/>
+  <path d="M16 12c-1 0-2 0-2 1 0 1 0 1 1 1l1 1 1-1c1 0 1 0 1-1 0-1-1-1-2-1z" fill="{line_color}"/>
+  <text x="16" y="26" text-anchor="middle" fill="{text_color}" font-family="Arial, sans-serif" font-size="6" font-weight="bold">{text}</text>
+</svg>'''
+
+def render_icon_set(text_lines=DEFAULT_TEXT_LINES, background=DEFAULT_BACKGROUND,
+                    heart_color=DEFAULT_HEART_COLOR, line_color=DEFAULT_LINE_COLOR,
+                    text_color=DEFAULT_TEXT_COLOR):
+    """Render a complete icon set as a list of (filename, bytes) pairs"""
+    files = []
+    for filename, size in ICON_SIZES.items():
+        icon = create_heart_icon(size, text=True, text_lines=text_lines,
+                                 background=background, heart_color=heart_color,
+                                 line_color=line_color, text_color=text_color)
+        buffer = io.BytesIO()
+        icon.save(buffer, 'PNG')
+        files.append((filename, buffer.getvalue()))
+    
+    # favicon.ico with a natively rendered frame per size; Pillow drops any
+    # size larger than the base image, so the largest frame is the base
+    favicon_images = [
+        create_heart_icon(fav_size[0], text=False, background=background,
+                          heart_color=heart_color, line_color=line_color)
+        for fav_size in FAVICON_SIZES
+    ]
+    buffer = io.BytesIO()
+    favicon_images[-1].save(buffer, format='ICO', sizes=FAVICON_SIZES,
+                            append_images=favicon_images[:-1])
+    files.append(('favicon.ico', buffer.getvalue()))
+    
+    svg_content = create_favicon_svg(" ".join(text_lines), background=background,
+                                     heart_color=heart_color, line_color=line_color,
+                                     text_color=text_color)
+    files.append(('favicon.svg', svg_content.encode('utf-8')))
+    
+    return files
+
 def generate_all_icons():
     """Generate all required icon sizes"""
-    sizes = {
-        'icon-72.png': 72,
-        'icon-96.png': 96,
-        'icon-144.png': 144,
-        'apple-touch-icon.png': 180,
-        'icon-192.png': 192,
-        'icon-512.png': 512
-    }
-    
     # Create assets directory if it doesn't exist
     os.makedirs('assets', exist_ok=True)
     
     print("🎨 Generating Bradley Health branded icons...")
     
-    for filename, size in sizes.items():
-        print(f"  Creating {filename} ({size}x{size})...")
-        icon = create_heart_icon(size, text=True)
-        icon.save(f'assets/{filename}', 'PNG')
+    # Same pipeline as the batch brand generator, with the default brand
+    for filename, data in render_icon_set():
+        with open(f'assets/{filename}', 'wb') as f:
+            f.write(data)
         print(f"    ✅ Saved {filename}")
     
-    # Create favicon.ico (16x16, 32x32, 48x48)
-    print("  Creating favicon.ico...")
-    favicon_sizes = [(16, 16), (32, 32), (48, 48)]
-    favicon_images = []
-    for fav_size in favicon_sizes:
-        favicon_img = create_heart_icon(fav_size[0], text=False)  # No text for small favicon
-        favicon_images.append(favicon_img)
-    
-    favicon_images[0].save('assets/favicon.ico', format='ICO', sizes=favicon_sizes)
-    print("    ✅ Saved favicon.ico")
-    
-    # Create favicon.svg
-    print("  Creating favicon.svg...")
-    svg_content = f'''<svg width="32" height="32" viewBox="0 0 32 32" xmlns="http://www.w3.org/2000/svg">
-  <rect width="32" height="32" rx="4" fill="#3b82f6"/>
-  <path d="M16 8c-2 0-4 1-4 3 0 1 0 2 1 3l3 3 3-3c1-1 1-2 1-3 0-2-2-3-4-3z" fill="#ef4444"/>
-  <path d="M16 12c-1 0-2 0-2 1 0 1 0 1 1 1l1 1 1-1c1 0 1 0 1-1 0-1-1-1-2-1z" fill="white"/>
-  <text x="16" y="26" text-anchor="middle" fill="white" font-family="Arial, sans-serif" font-size="6" font-weight="bold">Bradley Health</text>
-</svg>'''
-    
-    with open('assets/favicon.svg', 'w') as f:
-        f.write(svg_content)
-    print("    ✅ Saved favicon.svg")
-    
     print("\n🎉 All icons generated successfully!")
     print("📱 Icons include:")
     print("  - Red heart with blue background")
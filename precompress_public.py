@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Write precompressed gzip siblings for the text assets in public/
+
+The siblings are for a local or static server that serves precompressed
+files (e.g. nginx gzip_static). Firebase Hosting compresses responses itself,
+so firebase.json keeps them out of the deploy.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import gzip
+import hashlib
+import json
+import os
+
+# Text formats worth compressing; images and fonts are already compressed
+COMPRESSIBLE_EXTENSIONS = {
+    '.html', '.css', '.js', '.mjs', '.json', '.webmanifest',
+    '.svg', '.txt', '.xml', '.map'
+}
+
+# Below this size the gzip header and extra request outweigh the savings
+DEFAULT_MIN_SIZE = 1024
+
+# Remembers files that did not shrink so unchanged ones are not recompressed
+# every run; a dotfile, so neither the walk below nor firebase.json picks it up
+SKIP_MANIFEST = '.precompress-skipped.json'
+
+def walk_public_files(public_dir):
+    """Yield paths of every deployable file in public_dir"""
+    for root, dirs, files in os.walk(public_dir):
+        # Match firebase.json, which never deploys dotfiles or node_modules
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d != 'node_modules')
+        for name in sorted(files):
+            if not name.startswith('.'):
+                yield os.path.join(root, name)
+
+def is_compressible(path):
+    """Check whether path has a text extension worth precompressing"""
+    return os.path.splitext(path)[1].lower() in COMPRESSIBLE_EXTENSIONS
+
+def find_compressible_files(public_dir, min_size):
+    """Yield paths of text assets in public_dir at or above min_size bytes"""
+    for path in walk_public_files(public_dir):
+        if is_compressible(path) and os.path.getsize(path) >= min_size:
+            yield path
+
+def remove_stale_siblings(public_dir, current_gz_paths):
+    """Delete .gz siblings not backed by a current source, plus leftover .gz.tmp files"""
+    removed = []
+    for path in walk_public_files(public_dir):
+        if path.endswith('.gz.tmp'):
+            # Left behind by an interrupted run
+            os.remove(path)
+            removed.append(path)
+        elif path.endswith('.gz') and is_compressible(path[:-3]) and path not in current_gz_paths:
+            # Source was deleted, shrank below the threshold, or stopped compressing well
+            os.remove(path)
+            removed.append(path)
+    return removed
+
+def load_skip_manifest(public_dir):
+    """Load the {relative path: {'sha256', 'compressed'}} record of skipped files"""
+    try:
+        with open(os.path.join(public_dir, SKIP_MANIFEST)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def save_skip_manifest(public_dir, manifest):
+    """Write the skip record, replacing entries from earlier runs"""
+    path = os.path.join(public_dir, SKIP_MANIFEST)
+    if not manifest:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def is_up_to_date(path, gz_path):
+    """Check whether gz_path was written from the current contents of path"""
+    try:
+        gz_stat = os.stat(gz_path)
+    except FileNotFoundError:
+        return False
+    # Siblings carry their source's mtime, so any edit or re-copy invalidates them
+    return gz_stat.st_mtime_ns == os.stat(path).st_mtime_ns
+
+def read_gzip(gz_path):
+    """Return the decompressed contents of gz_path, or None if it is missing or unreadable"""
+    try:
+        with gzip.open(gz_path, 'rb') as f:
+            return f.read()
+    except (OSError, EOFError):
+        # Missing, truncated or not gzip at all; treat the source as changed
+        return None
+
+def compress_file(path, force=False, skip_record=None):
+    """Write path + '.gz' at maximum compression; return (path, original, compressed, status)
+
+    skip_record is this file's entry from the skip manifest, if any.
+    """
+    gz_path = path + '.gz'
+    source_stat = os.stat(path)
+
+    if not force and is_up_to_date(path, gz_path):
+        return path, source_stat.st_size, os.path.getsize(gz_path), 'unchanged'
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if not force and skip_record and skip_record.get('sha256') == hashlib.sha256(data).hexdigest():
+        # Same bytes as a file that did not shrink last time
+        return path, len(data), skip_record.get('compressed', len(data)), 'skipped'
+
+    # sync-to-public.sh copies without preserving mtimes, so fall back to
+    # comparing contents before paying for a level-9 recompress
+    if not force and read_gzip(gz_path) == data:
+        os.utime(gz_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        return path, len(data), os.path.getsize(gz_path), 'unchanged'
+
+    # Fixed header mtime and no filename keep the output byte-for-byte reproducible
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+
+    if len(compressed) >= len(data):
+        # Not worth serving; drop any stale sibling from an earlier build
+        if os.path.exists(gz_path):
+            os.remove(gz_path)
+        return path, len(data), len(compressed), 'skipped'
+
+    tmp_path = gz_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(compressed)
+    os.utime(tmp_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    os.replace(tmp_path, gz_path)
+
+    return path, len(data), len(compressed), 'written'
+
+def precompress(public_dir='public', min_size=DEFAULT_MIN_SIZE, workers=None, force=False):
+    """Compress every eligible file under public_dir in parallel; return (results, removed paths)"""
+    paths = list(find_compressible_files(public_dir, min_size))
+    skip_manifest = load_skip_manifest(public_dir)
+
+    def compress(path):
+        return compress_file(path, force, skip_manifest.get(os.path.relpath(path, public_dir)))
+
+    # zlib releases the GIL while compressing, so threads use every core
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(compress, paths))
+
+    # Rebuilt from this run only, so deleted or now-compressible files drop out
+    new_skip_manifest = {}
+    for path, _, compressed, status in results:
+        if status == 'skipped':
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            new_skip_manifest[os.path.relpath(path, public_dir)] = {
+                'sha256': digest, 'compressed': compressed
+            }
+    save_skip_manifest(public_dir, new_skip_manifest)
+
+    current_gz_paths = {path + '.gz' for path, _, _, status in results if status != 'skipped'}
+    removed = remove_stale_siblings(public_dir, current_gz_paths)
+    return results, removed
+
+def main():
+    parser = argparse.ArgumentParser(description='Write max-level gzip siblings for text assets')
+    parser.add_argument('public_dir', nargs='?', default='public',
+                        help='directory to precompress (default: public)')
+    parser.add_argument('--min-size', type=int, default=DEFAULT_MIN_SIZE,
+                        help=f'skip files smaller than this many bytes (default: {DEFAULT_MIN_SIZE})')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of parallel workers (default: CPU count based)')
+    parser.add_argument('--force', action='store_true',
+                        help='recompress files even if their .gz sibling is current')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.public_dir):
+        parser.error(f"{args.public_dir} is not a directory")
+
+    print(f"🗜️  Precompressing text assets in {args.public_dir}/...")
+
+    results, removed = precompress(args.public_dir, args.min_size, args.workers, args.force)
+
+    total_original = 0
+    total_compressed = 0
+    counts = {'written': 0, 'unchanged': 0, 'skipped': 0}
+    for path, original, compressed, status in results:
+        counts[status] += 1
+        ratio = compressed / original if original else 1.0
+        rel_path = os.path.relpath(path, args.public_dir)
+        print(f"  {status:<9} {rel_path}: {original} → {compressed} bytes ({ratio:.1%})")
+        if status != 'skipped':
+            total_original += original
+            total_compressed += compressed
+
+    for path in removed:
+        print(f"  {'removed':<9} {os.path.relpath(path, args.public_dir)}")
+
+    print(f"\n✅ {counts['written']} written, {counts['unchanged']} unchanged, "
+          f"{counts['skipped']} skipped (no gain), {len(removed)} stale removed")
+    if total_original:
+        print(f"📦 {total_original} → {total_compressed} bytes "
+              f"({total_compressed / total_original:.1%} of original)")
+
+if __name__ == "__main__":
+    main()
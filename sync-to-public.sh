@@ -43,6 +43,17 @@ cat > public/build-info.json << EOF
 }
 EOF
 
+# Opt-in: write gzip siblings for local/static servers that serve
+# precompressed files. Firebase ignores them, so deploys leave this off.
+if [ "${PRECOMPRESS:-0}" = "1" ]; then
+    echo "🗜️  Precompressing text assets..."
+    if command -v python3 >/dev/null 2>&1; then
+        python3 precompress_public.py public
+    else
+        echo "⚠️  python3 not found, skipping precompression"
+    fi
+fi
+
 echo "✅ Sync completed successfully!"
 echo "📁 Files synced to: public/"
 echo "🚀 Ready for Firebase deployment!"